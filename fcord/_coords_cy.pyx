@@ -0,0 +1,69 @@
+# cython: language_level=3
+"""Compiled drop-in replacement for fcord.coords.CartesianCoord."""
+from libc.math cimport fabs, hypot
+
+
+cdef class CartesianCoord:
+    """Compiled CartesianCoord, swapped into fcord.coords when the extension is built.
+
+    A cdef class cannot derive from the Python Coordinate base class, so fcord.coords registers
+    it as a virtual subclass instead: isinstance checks against Coordinate hold for both builds.
+    """
+    cdef public double x, y, z
+
+    def __init__(self, x, y, z):
+        self.x = float(x)
+        self.y = float(y)
+        self.z = float(z)
+
+    @property
+    def r(self) -> tuple:
+        return self.x, self.y, self.z
+
+    def __len__(self) -> int:
+        return 3
+
+    def __iter__(self):
+        return iter((self.x, self.y, self.z))
+
+    def __getitem__(self, index):
+        return (self.x, self.y, self.z)[index]
+
+    def l2_norm(self) -> float:
+        return hypot(hypot(self.x, self.y), self.z)
+
+    def horizontal_distance(self) -> float:
+        return hypot(self.x, self.y)
+
+    def vertical_distance(self) -> float:
+        return fabs(self.z)
+
+    def distance_to(self, CartesianCoord other not None) -> float:
+        return hypot(hypot(self.x - other.x, self.y - other.y), self.z - other.z)
+
+    def __repr__(self) -> str:
+        return f"CartesianCoord({self.x}, {self.y}, {self.z})"
+
+    def __add__(self, other):
+        if isinstance(other, CartesianCoord):
+            return _new(self.x + (<CartesianCoord>other).x,
+                        self.y + (<CartesianCoord>other).y,
+                        self.z + (<CartesianCoord>other).z)
+        else:
+            raise ValueError(f"Cannot add CartesianCoord to {type(other)}")
+
+    def __sub__(self, other):
+        if isinstance(other, CartesianCoord):
+            return _new(self.x - (<CartesianCoord>other).x,
+                        self.y - (<CartesianCoord>other).y,
+                        self.z - (<CartesianCoord>other).z)
+        else:
+            raise ValueError(f"Cannot subtract CartesianCoord from {type(other)}")
+
+
+cdef inline CartesianCoord _new(double x, double y, double z):
+    cdef CartesianCoord c = CartesianCoord.__new__(CartesianCoord)
+    c.x = x
+    c.y = y
+    c.z = z
+    return c
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import math
+import numpy as np
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    # numba is optional, fall back to plain Python functions
+    HAS_NUMBA = False
+    prange = range  # type: ignore[misc]
+
+    def njit(*args, **kwargs):  # type: ignore[no-redef]
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+# WGS-84 ellipsoid
+A = 6378137.0  # Semi-major axis
+F = 1 / 298.257223563  # Flattening
+B = A * (1 - F)
+E2 = (A * A - B * B) / (A * A)  # Square of eccentricity
+ONE_MINUS_E2 = 1 - E2
+
+DEG2RAD = math.pi / 180  # Same factor math.radians multiplies by
+
+R_MEAN = 6371008.8  # Mean earth radius of the spherical model used by haversine
+
+
+@njit(cache=True)
+def ecef_kernel(lat: float, lon: float, alt: float) -> tuple[float, float, float]:
+    """Returns the ECEF coordinates of a single GPS coordinate given in degrees."""
+    lat_rad = lat * DEG2RAD
+    lon_rad = lon * DEG2RAD
+    sin_lat = math.sin(lat_rad)
+    cos_lat = math.cos(lat_rad)
+
+    N = A / math.sqrt(1 - E2 * sin_lat * sin_lat)
+    p = (N + alt) * cos_lat  # Distance from the polar axis
+    x = p * math.cos(lon_rad)
+    y = p * math.sin(lon_rad)
+    z = (N * ONE_MINUS_E2 + alt) * sin_lat
+    return x, y, z
+
+
+@njit(cache=True, parallel=True)
+def ecef_kernel_vec(lat: np.ndarray, lon: np.ndarray, alt: np.ndarray) -> np.ndarray:
+    """Returns the ECEF coordinates of 1-D float64 arrays as an array of shape (3, N)."""
+    out = np.empty((3, lat.shape[0]))
+    for i in prange(lat.shape[0]):
+        out[0, i], out[1, i], out[2, i] = ecef_kernel(lat[i], lon[i], alt[i])
+    return out
+
+
+def ecef_numpy(lat: np.ndarray, lon: np.ndarray, alt: np.ndarray) -> np.ndarray:
+    """Returns the ECEF coordinates of float64 arrays as an array of shape (3, ...)."""
+    lat_rad = lat * DEG2RAD
+    lon_rad = lon * DEG2RAD
+    sin_lat = np.sin(lat_rad)
+    cos_lat = np.cos(lat_rad)
+
+    N = A / np.sqrt(1 - E2 * sin_lat * sin_lat)
+    p = (N + alt) * cos_lat  # Distance from the polar axis
+    x = p * np.cos(lon_rad)
+    y = p * np.sin(lon_rad)
+    z = (N * ONE_MINUS_E2 + alt) * sin_lat
+    return np.stack((x, y, z))
+
+
+def ecef_batch(lat, lon, alt) -> np.ndarray:
+    """Returns the ECEF coordinates of arrays of GPS coordinates as an array of shape (3, N)."""
+    lat, lon, alt = np.broadcast_arrays(
+        np.asarray(lat, dtype=np.float64),
+        np.asarray(lon, dtype=np.float64),
+        np.asarray(alt, dtype=np.float64),
+    )
+    if not HAS_NUMBA:
+        return ecef_numpy(lat, lon, alt)
+    xyz = ecef_kernel_vec(lat.ravel(), lon.ravel(), alt.ravel())
+    return xyz.reshape((3,) + lat.shape)
+
+
+@njit(cache=True)
+def haversine_kernel(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Returns the great-circle distance between two GPS coordinates given in degrees."""
+    lat1_rad = lat1 * DEG2RAD
+    lat2_rad = lat2 * DEG2RAD
+    sin_dlat = math.sin((lat2_rad - lat1_rad) / 2)
+    sin_dlon = math.sin((lon2 - lon1) * DEG2RAD / 2)
+
+    a = sin_dlat * sin_dlat + math.cos(lat1_rad) * math.cos(lat2_rad) * sin_dlon * sin_dlon
+    return 2 * R_MEAN * math.asin(math.sqrt(min(a, 1.0)))
+
+
+def haversine_batch(lat1, lon1, lat2, lon2) -> np.ndarray:
+    """Returns the element-wise great-circle (surface) distances between arrays of GPS coordinates.
+
+    The earth is modelled as a sphere, which is off by up to about 0.5% compared to the geodesic
+    on the WGS-84 ellipsoid. Use it for bulk estimates such as route lengths. This is not the
+    same quantity as the ECEF distance (pairwise_distance, GPSCoord.distance), which is the 3-D
+    chord through the earth and only matches the surface arc for short separations.
+    """
+    lat1_rad = np.asarray(lat1, dtype=np.float64) * DEG2RAD
+    lat2_rad = np.asarray(lat2, dtype=np.float64) * DEG2RAD
+    dlon_rad = (np.asarray(lon2, dtype=np.float64) - np.asarray(lon1, dtype=np.float64)) * DEG2RAD
+    sin_dlat = np.sin((lat2_rad - lat1_rad) / 2)
+    sin_dlon = np.sin(dlon_rad / 2)
+
+    a = sin_dlat * sin_dlat + np.cos(lat1_rad) * np.cos(lat2_rad) * sin_dlon * sin_dlon
+    return 2 * R_MEAN * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import math
+import numpy as np
+from fcord._kernels import A, E2, ONE_MINUS_E2, DEG2RAD, ecef_kernel
+
+# Constants of Olson's closed-form ECEF to geodetic conversion, see
+# D. K. Olson, "Converting Earth-Centered, Earth-Fixed Coordinates to Geodetic Coordinates", 1996.
+_A1 = A * E2
+_A2 = _A1 * _A1
+_A3 = _A1 * E2 / 2
+_A4 = 2.5 * _A2
+_A5 = _A1 + _A3
+
+RAD2DEG = 180 / math.pi
+
+
+def ned2lla(n: float, e: float, d: float, ref_lat: float, ref_lon: float, ref_alt: float) -> tuple[float, float, float]:
+    """Returns lat, lon (degrees) and alt of a NED offset from a GPS reference given in degrees."""
+    lat_rad = ref_lat * DEG2RAD
+    lon_rad = ref_lon * DEG2RAD
+    sin_lat = math.sin(lat_rad)
+    cos_lat = math.cos(lat_rad)
+    sin_lon = math.sin(lon_rad)
+    cos_lon = math.cos(lon_rad)
+
+    x0, y0, z0 = ecef_kernel(ref_lat, ref_lon, ref_alt)
+    h = -sin_lat * n - cos_lat * d  # Component of the offset in the equatorial plane
+    x = x0 + h * cos_lon - sin_lon * e
+    y = y0 + h * sin_lon + cos_lon * e
+    z = z0 + cos_lat * n - sin_lat * d
+    return _ecef2lla(x, y, z)
+
+
+def _ecef2lla(x: float, y: float, z: float) -> tuple[float, float, float]:
+    zp = abs(z)
+    w2 = x * x + y * y
+    w = math.sqrt(w2)
+    r2 = w2 + z * z
+    r = math.sqrt(r2)
+    lon = math.atan2(y, x)
+    s2 = z * z / r2
+    c2 = w2 / r2
+    u = _A2 / r
+    v = _A3 - _A4 / r
+    if c2 > 0.3:
+        s = (zp / r) * (1 + c2 * (_A1 + u + s2 * v) / r)
+        lat = math.asin(s)
+        ss = s * s
+        c = math.sqrt(1 - ss)
+    else:
+        c = (w / r) * (1 - s2 * (_A5 - u - c2 * v) / r)
+        lat = math.acos(c)
+        ss = 1 - c * c
+        s = math.sqrt(ss)
+    g = 1 - E2 * ss
+    rg = A / math.sqrt(g)
+    rf = ONE_MINUS_E2 * rg
+    u = w - rg * c
+    v = zp - rf * s
+    f = c * u + s * v
+    m = c * v - s * u
+    p = m / (rf / g + f)
+    lat = lat + p
+    alt = f + m * p / 2
+    if z < 0:
+        lat = -lat
+    return lat * RAD2DEG, lon * RAD2DEG, alt
+
+
+def ned2lla_batch(n, e, d, ref_lat: float, ref_lon: float, ref_alt: float) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Vectorized ned2lla for arrays of NED offsets from a single GPS reference."""
+    n = np.asarray(n, dtype=np.float64)
+    e = np.asarray(e, dtype=np.float64)
+    d = np.asarray(d, dtype=np.float64)
+    lat_rad = ref_lat * DEG2RAD
+    lon_rad = ref_lon * DEG2RAD
+    sin_lat = math.sin(lat_rad)
+    cos_lat = math.cos(lat_rad)
+    sin_lon = math.sin(lon_rad)
+    cos_lon = math.cos(lon_rad)
+
+    x0, y0, z0 = ecef_kernel(ref_lat, ref_lon, ref_alt)
+    h = -sin_lat * n - cos_lat * d
+    x = x0 + h * cos_lon - sin_lon * e
+    y = y0 + h * sin_lon + cos_lon * e
+    z = z0 + cos_lat * n - sin_lat * d
+    return _ecef2lla_batch(x, y, z)
+
+
+def _ecef2lla_batch(x: np.ndarray, y: np.ndarray, z: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    zp = np.abs(z)
+    w2 = x * x + y * y
+    w = np.sqrt(w2)
+    r2 = w2 + z * z
+    r = np.sqrt(r2)
+    lon = np.arctan2(y, x)
+    s2 = z * z / r2
+    c2 = w2 / r2
+    u = _A2 / r
+    v = _A3 - _A4 / r
+    # Both branches of the scalar version are evaluated and selected per element,
+    # clipping keeps the discarded branch inside the domain of arcsin/arccos.
+    use_sin = c2 > 0.3
+    s_hi = np.clip((zp / r) * (1 + c2 * (_A1 + u + s2 * v) / r), -1, 1)
+    c_lo = np.clip((w / r) * (1 - s2 * (_A5 - u - c2 * v) / r), -1, 1)
+    lat = np.where(use_sin, np.arcsin(s_hi), np.arccos(c_lo))
+    ss = np.where(use_sin, s_hi * s_hi, 1 - c_lo * c_lo)
+    s = np.where(use_sin, s_hi, np.sqrt(ss))
+    c = np.where(use_sin, np.sqrt(1 - ss), c_lo)
+    g = 1 - E2 * ss
+    rg = A / np.sqrt(g)
+    rf = ONE_MINUS_E2 * rg
+    u = w - rg * c
+    v = zp - rf * s
+    f = c * u + s * v
+    m = c * v - s * u
+    p = m / (rf / g + f)
+    lat = lat + p
+    alt = f + m * p / 2
+    lat = np.where(z < 0, -lat, lat)
+    return lat * RAD2DEG, lon * RAD2DEG, alt
@@ -1,80 +1,183 @@
+from __future__ import annotations
+
 import math
-from navpy import ned2lla
+import numpy as np
+from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from typing import SupportsFloat
 from px4_interfaces.msg import Ned, Gps
+from fcord._kernels import ecef_batch, ecef_kernel, haversine_batch, haversine_kernel
+from fcord._ned_lla import ned2lla, ned2lla_batch
+
+
+def pairwise_distance(a, b) -> np.ndarray:
+    """Returns the element-wise distances between two arrays of GPS coordinates.
+
+    Both arguments are array-likes of shape (3, N) holding lat, lon and alt rows.
+    """
+    xyz_a = ecef_batch(*a)
+    xyz_b = ecef_batch(*b)
+    return np.linalg.norm(xyz_a - xyz_b, axis=0)
+
 
+class Coordinate(ABC):
+    __slots__ = ()
 
-class Coordinate:
-    def __init__(self):
+    def __init__(self) -> None:
         pass
-        
+
+    def __len__(self) -> int:
+        return 3
+
+    def __iter__(self) -> Iterator[float]:
+        return iter(self.r)
+
+    def __getitem__(self, index: int) -> float:
+        return self.r[index]
+
+    @property
+    @abstractmethod
+    def r(self) -> tuple[float, float, float]:
+        ...
+
     def l2_norm(self) -> float:
-        return sum([x ** 2 for x in self.r]) ** 0.5
+        return math.hypot(*self.r)
 
     def horizontal_distance(self) -> float:
-        return sum([x ** 2 for x in self.r[:2]]) ** 0.5
+        a, b, _ = self.r
+        return math.hypot(a, b)
 
     def vertical_distance(self) -> float:
         return abs(self.r[2])
 
 
 class CartesianCoord(Coordinate):
-    def __init__(self, x: float | int, y: float | int, z: float | int):
+    __slots__ = ("x", "y", "z")
+
+    def __init__(self, x: SupportsFloat, y: SupportsFloat, z: SupportsFloat) -> None:
         super().__init__()
         self.x = float(x)
         self.y = float(y)
         self.z = float(z)
 
     @property
-    def r(self) -> list[float]:
-        return [self.x, self.y, self.z]
+    def r(self) -> tuple[float, float, float]:
+        return self.x, self.y, self.z
+
+    def l2_norm(self) -> float:
+        return math.hypot(self.x, self.y, self.z)
+
+    def horizontal_distance(self) -> float:
+        return math.hypot(self.x, self.y)
+
+    def distance_to(self, other: "CartesianCoord") -> float:
+        return math.hypot(self.x - other.x, self.y - other.y, self.z - other.z)
+
+    def __reduce__(self) -> tuple[type, tuple]:
+        return CartesianCoord, (self.x, self.y, self.z)
 
     def __repr__(self) -> str:
         return f"CartesianCoord({self.x}, {self.y}, {self.z})"
 
-    def __add__(self, other):
-        if isinstance(other, CartesianCoord):
+    def __add__(self, other) -> "CartesianCoord":
+        if type(other) is CartesianCoord or isinstance(other, CartesianCoord):
             return CartesianCoord(self.x + other.x, self.y + other.y, self.z + other.z)
         else:
             raise ValueError(f"Cannot add CartesianCoord to {type(other)}")
 
-    def __sub__(self, other):
-        if isinstance(other, CartesianCoord):
+    def __sub__(self, other) -> "CartesianCoord":
+        if type(other) is CartesianCoord or isinstance(other, CartesianCoord):
             return CartesianCoord(self.x - other.x, self.y - other.y, self.z - other.z)
         else:
             raise ValueError(f"Cannot subtract CartesianCoord from {type(other)}")
 
 
 class GPSCoord:
-    def __init__(self, lat: float | int, lon: float | int, alt: float | int, yaw: float = "nan"):
-        self.lat = float(lat)
-        self.lon = float(lon)
-        self.alt = float(alt)
+    __slots__ = ("_lat", "_lon", "_alt", "yaw", "_ecef")
+
+    def __init__(self, lat: SupportsFloat, lon: SupportsFloat, alt: SupportsFloat, yaw: SupportsFloat = math.nan) -> None:
+        self._lat = float(lat)
+        self._lon = float(lon)
+        self._alt = float(alt)
         self.yaw = float(yaw)
+        self._ecef: tuple[float, float, float] | None = None
 
+    # The position is exposed through properties so that assigning to it drops the cached ECEF
     @property
-    def r(self) -> list[float]:
-        return [self.lat, self.lon, self.alt]
+    def lat(self) -> float:
+        return self._lat
+
+    @lat.setter
+    def lat(self, value: SupportsFloat) -> None:
+        self._lat = float(value)
+        self._ecef = None
+
+    @property
+    def lon(self) -> float:
+        return self._lon
+
+    @lon.setter
+    def lon(self, value: SupportsFloat) -> None:
+        self._lon = float(value)
+        self._ecef = None
+
+    @property
+    def alt(self) -> float:
+        return self._alt
+
+    @alt.setter
+    def alt(self, value: SupportsFloat) -> None:
+        self._alt = float(value)
+        self._ecef = None
+
+    @property
+    def r(self) -> tuple[float, float, float]:
+        return self.lat, self.lon, self.alt
+
+    def __len__(self) -> int:
+        return 3
+
+    def __iter__(self) -> Iterator[float]:
+        return iter(self.r)
+
+    def __getitem__(self, index: int) -> float:
+        return self.r[index]
+
+    def __reduce__(self) -> tuple[type, tuple]:
+        return GPSCoord, (self._lat, self._lon, self._alt, self.yaw)
 
     def __repr__(self) -> str:
         return f"GPSCoord({self.lat}, {self.lon}, {self.alt})"
 
-    def ecef(self):
+    def _ecef_tuple(self) -> tuple[float, float, float]:
+        """Returns the ECEF coordinates as a tuple, computed once and cached."""
+        xyz = self._ecef
+        if xyz is None:
+            xyz = self._ecef = ecef_kernel(self._lat, self._lon, self._alt)
+        return xyz
+
+    def ecef(self) -> "CartesianCoord":
         """Returns the ECEF coordinates of the GPS coordinates."""
-        a = 6378137.0  # Semi-major axis
-        f = 1 / 298.257223563  # Flattening
-        b = a * (1 - f)
-        e2 = (a ** 2 - b ** 2) / a ** 2  # Square of eccentricity
-        lat_rad = math.radians(self.lat)
-        lon_rad = math.radians(self.lon)
-
-        N = a / (1 - e2 * math.sin(lat_rad) ** 2) ** 0.5
-        x = (N + self.alt) * math.cos(lat_rad) * math.cos(lon_rad)
-        y = (N + self.alt) * math.cos(lat_rad) * math.sin(lon_rad)
-        z = (N * (1 - e2) + self.alt) * math.sin(lat_rad)
-        return CartesianCoord(x, y, z)
+        return CartesianCoord(*self._ecef_tuple())
 
     def distance(self, other) -> float:
-        return (self.ecef() - other.ecef()).l2_norm()
+        """Returns the straight-line (chord) distance between the WGS-84 ECEF positions."""
+        ax, ay, az = self._ecef_tuple()
+        bx, by, bz = other._ecef_tuple()
+        return math.hypot(ax - bx, ay - by, az - bz)
+
+    def haversine(self, other: "GPSCoord") -> float:
+        """Returns the great-circle (surface) distance on a spherical earth, ignoring altitude.
+
+        This measures something different from distance(), which is the 3-D chord between the
+        ECEF positions and only matches the surface arc for short separations. The spherical
+        model is off by up to about 0.5% compared to the geodesic on the WGS-84 ellipsoid.
+        """
+        return haversine_kernel(self.lat, self.lon, other.lat, other.lon)
+
+    @staticmethod
+    def from_arrays(lat, lon, alt) -> list["GPSCoord"]:
+        return [GPSCoord(la, lo, al) for la, lo, al in zip(lat, lon, alt)]
 
     def to_msg(self) -> Gps:
         msg = Gps()
@@ -91,9 +194,97 @@ class GPSCoord:
         else:
             return GPSCoord(msg.lat, msg.lon, msg.alt)
 
+    @staticmethod
+    def to_msg_many(coords: list["GPSCoord"]) -> list[Gps]:
+        _Gps = Gps
+        msgs: list[Gps] = []
+        append = msgs.append
+        for c in coords:
+            msg = _Gps()
+            msg.lat = c.lat
+            msg.lon = c.lon
+            msg.alt = c.alt
+            msg.yaw = c.yaw
+            append(msg)
+        return msgs
+
+    @staticmethod
+    def from_msg_many(msgs: list[Gps]) -> list["GPSCoord"]:
+        _GPSCoord = GPSCoord
+        if msgs and hasattr(msgs[0], "yaw"):
+            return [_GPSCoord(m.lat, m.lon, m.alt, m.yaw) for m in msgs]
+        return [_GPSCoord(m.lat, m.lon, m.alt) for m in msgs]
+
+
+class GPSBatch:
+    """Structure-of-arrays container for many GPS coordinates.
+
+    Stores lat, lon, alt and yaw as contiguous float64 arrays so conversions run as single
+    vectorized calls instead of once per GPSCoord.
+    """
+    __slots__ = ("lat", "lon", "alt", "yaw")
+
+    def __init__(self, lat, lon, alt, yaw=None) -> None:
+        lat = np.asarray(lat, dtype=np.float64)
+        lon = np.asarray(lon, dtype=np.float64)
+        alt = np.asarray(alt, dtype=np.float64)
+        yaw = np.full(lat.shape, math.nan) if yaw is None else np.asarray(yaw, dtype=np.float64)
+        for name, values in (("lat", lat), ("lon", lon), ("alt", alt), ("yaw", yaw)):
+            if values.ndim != 1:
+                raise ValueError(f"GPSBatch {name} must be 1-D, got shape {values.shape}")
+            if len(values) != len(lat):
+                raise ValueError(f"GPSBatch {name} has {len(values)} values, lat has {len(lat)}")
+        self.lat = np.ascontiguousarray(lat)
+        self.lon = np.ascontiguousarray(lon)
+        self.alt = np.ascontiguousarray(alt)
+        self.yaw = np.ascontiguousarray(yaw)
+
+    def __len__(self) -> int:
+        return len(self.lat)
+
+    def __iter__(self) -> Iterator[GPSCoord]:
+        for lat, lon, alt, yaw in zip(self.lat.tolist(), self.lon.tolist(), self.alt.tolist(), self.yaw.tolist()):
+            yield GPSCoord(lat, lon, alt, yaw)
+
+    def __reduce__(self) -> tuple[type, tuple]:
+        return GPSBatch, (self.lat, self.lon, self.alt, self.yaw)
+
+    def __repr__(self) -> str:
+        return f"GPSBatch({len(self)} coordinates)"
+
+    def ecef(self) -> np.ndarray:
+        """Returns the ECEF coordinates as an array of shape (3, N)."""
+        return ecef_batch(self.lat, self.lon, self.alt)
+
+    def _check_same_length(self, other: "GPSBatch") -> None:
+        if len(other) != len(self):
+            raise ValueError(f"Cannot compare GPSBatch of {len(self)} coordinates with {len(other)}")
+
+    def distance(self, other: "GPSBatch") -> np.ndarray:
+        self._check_same_length(other)
+        return pairwise_distance((self.lat, self.lon, self.alt), (other.lat, other.lon, other.alt))
+
+    def haversine(self, other: "GPSBatch") -> np.ndarray:
+        self._check_same_length(other)
+        return haversine_batch(self.lat, self.lon, other.lat, other.lon)
+
+    @staticmethod
+    def from_gpscoords(coords: list[GPSCoord]) -> "GPSBatch":
+        return GPSBatch(
+            [c.lat for c in coords],
+            [c.lon for c in coords],
+            [c.alt for c in coords],
+            [c.yaw for c in coords],
+        )
+
+    def to_gpscoords(self) -> list[GPSCoord]:
+        return list(self)
+
 
 class ENUCoord(Coordinate):
-    def __init__(self, e: float | int, n: float | int, u: float | int, yaw: float = "nan"):
+    __slots__ = ("e", "n", "u", "yaw")
+
+    def __init__(self, e: SupportsFloat, n: SupportsFloat, u: SupportsFloat, yaw: SupportsFloat = math.nan) -> None:
         super().__init__()
         self.e = float(e)
         self.n = float(n)
@@ -101,8 +292,17 @@ class ENUCoord(Coordinate):
         self.yaw = float(yaw)
 
     @property
-    def r(self) -> list[float]:
-        return [self.e, self.n, self.u]
+    def r(self) -> tuple[float, float, float]:
+        return self.e, self.n, self.u
+
+    def l2_norm(self) -> float:
+        return math.hypot(self.e, self.n, self.u)
+
+    def horizontal_distance(self) -> float:
+        return math.hypot(self.e, self.n)
+
+    def __reduce__(self) -> tuple[type, tuple]:
+        return ENUCoord, (self.e, self.n, self.u, self.yaw)
 
     def __repr__(self) -> str:
         return f"ENUCoord({self.e}, {self.n}, {self.u})"
@@ -110,25 +310,29 @@ class ENUCoord(Coordinate):
     def to_ned(self) -> "NEDCoord":
         return NEDCoord(self.n, self.e, -self.u)
 
-    def __add__(self, other):
-        if isinstance(other, ENUCoord):
+    def __add__(self, other) -> "ENUCoord":
+        t = type(other)
+        if t is ENUCoord or isinstance(other, ENUCoord):
             return ENUCoord(self.e + other.e, self.n + other.n, self.u + other.u)
-        elif isinstance(other, NEDCoord):
-            return self + other.to_enu()
+        elif t is NEDCoord or isinstance(other, NEDCoord):
+            return ENUCoord(self.e + other.e, self.n + other.n, self.u - other.d)
         else:
             raise ValueError(f"Cannot add ENUCoord to {type(other)}")
 
-    def __sub__(self, other):
-        if isinstance(other, ENUCoord):
+    def __sub__(self, other) -> "ENUCoord":
+        t = type(other)
+        if t is ENUCoord or isinstance(other, ENUCoord):
             return ENUCoord(self.e - other.e, self.n - other.n, self.u - other.u)
-        elif isinstance(other, NEDCoord):
-            return self - other.to_enu()
+        elif t is NEDCoord or isinstance(other, NEDCoord):
+            return ENUCoord(self.e - other.e, self.n - other.n, self.u + other.d)
         else:
             raise ValueError(f"Cannot subtract ENUCoord from {type(other)}")
 
 
 class NEDCoord(Coordinate):
-    def __init__(self, n: float | int, e: float | int, d: float | int,  yaw: float = "nan"):
+    __slots__ = ("n", "e", "d", "yaw")
+
+    def __init__(self, n: SupportsFloat, e: SupportsFloat, d: SupportsFloat, yaw: SupportsFloat = math.nan) -> None:
         super().__init__()
         self.n = float(n)
         self.e = float(e)
@@ -136,8 +340,17 @@ class NEDCoord(Coordinate):
         self.yaw = float(yaw)
 
     @property
-    def r(self) -> list[float]:
-        return [self.n, self.e, self.d]
+    def r(self) -> tuple[float, float, float]:
+        return self.n, self.e, self.d
+
+    def l2_norm(self) -> float:
+        return math.hypot(self.n, self.e, self.d)
+
+    def horizontal_distance(self) -> float:
+        return math.hypot(self.n, self.e)
+
+    def __reduce__(self) -> tuple[type, tuple]:
+        return NEDCoord, (self.n, self.e, self.d, self.yaw)
 
     def __repr__(self) -> str:
         return f"NEDCoord({self.n}, {self.e}, {self.d})"
@@ -146,22 +359,29 @@ class NEDCoord(Coordinate):
         return ENUCoord(self.e, self.n, -self.d)
 
     def to_gps(self, ref: GPSCoord) -> GPSCoord:
-        lat, lon, alt = ned2lla(self.r, ref.lat, ref.lon, ref.alt)
+        lat, lon, alt = ned2lla(self.n, self.e, self.d, ref.lat, ref.lon, ref.alt)
         return GPSCoord(lat, lon, alt)
 
-    def __add__(self, other):
-        if isinstance(other, NEDCoord):
+    @staticmethod
+    def to_gps_batch(ref: GPSCoord, n, e, d) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Converts arrays of NED offsets from ref into lat, lon and alt arrays."""
+        return ned2lla_batch(n, e, d, ref.lat, ref.lon, ref.alt)
+
+    def __add__(self, other) -> "NEDCoord":
+        t = type(other)
+        if t is NEDCoord or isinstance(other, NEDCoord):
             return NEDCoord(self.n + other.n, self.e + other.e, self.d + other.d)
-        elif isinstance(other, ENUCoord):
-            return self + other.to_ned()
+        elif t is ENUCoord or isinstance(other, ENUCoord):
+            return NEDCoord(self.n + other.n, self.e + other.e, self.d - other.u)
         else:
             raise ValueError(f"Cannot add NEDCoord to {type(other)}")
 
-    def __sub__(self, other):
-        if isinstance(other, NEDCoord):
+    def __sub__(self, other) -> "NEDCoord":
+        t = type(other)
+        if t is NEDCoord or isinstance(other, NEDCoord):
             return NEDCoord(self.n - other.n, self.e - other.e, self.d - other.d)
-        elif isinstance(other, ENUCoord):
-            return self - other.to_ned()
+        elif t is ENUCoord or isinstance(other, ENUCoord):
+            return NEDCoord(self.n - other.n, self.e - other.e, self.d + other.u)
         else:
             raise ValueError(f"Cannot subtract NEDCoord from {type(other)}")
 
@@ -176,3 +396,30 @@ class NEDCoord(Coordinate):
     @staticmethod
     def from_msg(msg: Ned) -> "NEDCoord":
         return NEDCoord(msg.n, msg.e, msg.d, msg.yaw)
+
+    @staticmethod
+    def to_msg_many(coords: list["NEDCoord"]) -> list[Ned]:
+        _Ned = Ned
+        msgs: list[Ned] = []
+        append = msgs.append
+        for c in coords:
+            msg = _Ned()
+            msg.n = c.n
+            msg.e = c.e
+            msg.d = c.d
+            msg.yaw = c.yaw
+            append(msg)
+        return msgs
+
+    @staticmethod
+    def from_msg_many(msgs: list[Ned]) -> list["NEDCoord"]:
+        _NEDCoord = NEDCoord
+        return [_NEDCoord(m.n, m.e, m.d, m.yaw) for m in msgs]
+
+
+try:
+    from fcord._coords_cy import CartesianCoord  # type: ignore[no-redef]  # noqa: F811
+except ImportError:
+    pass
+else:
+    Coordinate.register(CartesianCoord)
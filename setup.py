@@ -1,10 +1,38 @@
+import os
 from setuptools import setup, find_packages
 
+# FCORD_COMPILE picks how fcord.coords is compiled: "none" (default) ships pure Python,
+# "mypyc" compiles the whole module, "cython" only builds the compiled CartesianCoord.
+# The build tool has to be installed in the build environment, e.g. with
+# `pip install mypy && FCORD_COMPILE=mypyc pip install --no-build-isolation .`.
+# A missing mypy falls back to Cython, failing builds to pure Python.
+compile_mode = os.environ.get("FCORD_COMPILE", "none")
+ext_modules = []
+
+if compile_mode == "mypyc":
+   try:
+      from mypyc.build import mypycify
+      ext_modules = mypycify(["fcord/coords.py"])
+   except ImportError:
+      compile_mode = "cython"
+
+if compile_mode == "cython":
+   try:
+      from Cython.Build import cythonize
+      ext_modules = cythonize(["fcord/_coords_cy.pyx"])
+   except ImportError:
+      pass
+
+for ext in ext_modules:
+   ext.optional = True
+
 setup(
    name='fcord',
    version='0.1',
    packages=find_packages(),
-   install_requires=["navpy>=1.0"],
+   ext_modules=ext_modules,
+   install_requires=["numpy"],
+   extras_require={"numba": ["numba"]},
    description='A short description of your package',
    # long_description=open('README.md').read(),
    # long_description_content_type='text/markdown',
@@ -0,0 +1,200 @@
+import copy
+import math
+import pickle
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+pytest.importorskip("px4_interfaces")
+
+from fcord.coords import CartesianCoord, Coordinate, ENUCoord, GPSBatch, GPSCoord, NEDCoord  # noqa: E402
+
+
+def test_gps_distance_matches_ecef():
+    a = GPSCoord(52, 13, 100)
+    b = GPSCoord(52.001, 13.001, 110)
+    assert a.distance(b) == pytest.approx((a.ecef() - b.ecef()).l2_norm())
+
+
+@pytest.mark.parametrize("field, value", [("lat", 50.0), ("lon", 8.0), ("alt", 500.0)])
+def test_gps_assignment_invalidates_ecef(field, value):
+    g = GPSCoord(1, 2, 3)
+    g.ecef()
+    setattr(g, field, value)
+    expected = GPSCoord(*(value if f == field else getattr(g, f) for f in ("lat", "lon", "alt")))
+    assert g.ecef().r == expected.ecef().r
+    assert g.distance(expected) == 0.0
+
+
+def test_gps_nan_position():
+    assert math.isnan(GPSCoord(math.nan, 8, 0).distance(GPSCoord(1, 2, 3)))
+
+
+def test_frame_conversion_returns_independent_copies():
+    ned = NEDCoord(1, 2, 3)
+    enu = ned.to_enu()
+    enu.e = 100
+    assert ned.to_enu().r == (2.0, 1.0, -3.0)
+    ned.n = 10
+    assert ned.to_enu().r == (2.0, 10.0, -3.0)
+    assert ENUCoord(2, 1, -3).to_ned().r == (1.0, 2.0, 3.0)
+
+
+def test_cross_frame_arithmetic():
+    ned = NEDCoord(1, 2, 3)
+    enu = ENUCoord(4, 5, 6)
+    assert (ned + enu).r == (ned + enu.to_ned()).r
+    assert (ned - enu).r == (ned - enu.to_ned()).r
+    assert (enu + ned).r == (enu + ned.to_enu()).r
+    assert (enu - ned).r == (enu - ned.to_enu()).r
+
+
+def test_coordinate_is_abstract():
+    with pytest.raises(TypeError):
+        Coordinate()
+
+
+@pytest.mark.parametrize(
+    "coord",
+    [CartesianCoord(1, 2, 3), GPSCoord(52, 13, 100, 0.5), ENUCoord(1, 2, 3, 0.5), NEDCoord(1, 2, 3, 0.5)],
+    ids=lambda c: type(c).__name__,
+)
+def test_pickle_and_copy(coord):
+    for clone in (pickle.loads(pickle.dumps(coord)), copy.copy(coord), copy.deepcopy(coord)):
+        assert type(clone) is type(coord)
+        assert clone.r == coord.r
+        assert getattr(clone, "yaw", None) == getattr(coord, "yaw", None)
+
+
+def test_pickle_gps_batch():
+    batch = pickle.loads(pickle.dumps(GPSBatch([1, 2], [3, 4], [5, 6])))
+    assert [c.r for c in batch] == [(1.0, 3.0, 5.0), (2.0, 4.0, 6.0)]
+
+
+@pytest.mark.parametrize("value", [np.float32(1), np.int64(1), np.float64(1), 1])
+def test_constructors_accept_numpy_scalars(value):
+    assert NEDCoord(value, 2, 3).r == (1.0, 2.0, 3.0)
+    assert ENUCoord(value, 2, 3).r == (1.0, 2.0, 3.0)
+    assert CartesianCoord(value, 2, 3).r == (1.0, 2.0, 3.0)
+    assert GPSCoord(value, 2, 3).r == (1.0, 2.0, 3.0)
+
+
+def test_gps_from_int_arrays():
+    coords = GPSCoord.from_arrays(np.array([1, 2]), np.array([3, 4]), np.array([5, 6]))
+    assert [c.r for c in coords] == [(1.0, 3.0, 5.0), (2.0, 4.0, 6.0)]
+
+
+def test_cartesian_is_coordinate():
+    assert isinstance(CartesianCoord(1, 2, 3), Coordinate)
+    assert isinstance(GPSCoord(52, 13, 100).ecef(), Coordinate)
+
+
+def test_cartesian_norms_do_not_overflow():
+    c = CartesianCoord(1e200, 1e200, 0)
+    assert c.l2_norm() == pytest.approx(math.sqrt(2) * 1e200)
+    assert c.distance_to(CartesianCoord(0, 0, 0)) == pytest.approx(math.sqrt(2) * 1e200)
+
+
+def test_cartesian_distance_to():
+    assert CartesianCoord(1, 2, 3).distance_to(CartesianCoord(2, 4, 5)) == 3.0
+    with pytest.raises((TypeError, AttributeError)):
+        CartesianCoord(1, 2, 3).distance_to(None)
+
+
+def test_gps_batch_round_trip():
+    coords = [GPSCoord(52, 13, 0, 1.0), GPSCoord(48.1, 11.6, 5)]
+    batch = GPSBatch.from_gpscoords(coords)
+    assert len(batch) == 2
+    assert [c.r for c in batch.to_gpscoords()] == [c.r for c in coords]
+    assert batch.to_gpscoords()[0].yaw == 1.0
+
+
+def test_gps_batch_distances_match_scalar():
+    a = [GPSCoord(52, 13, 0), GPSCoord(48.1, 11.6, 5)]
+    b = [GPSCoord(52.001, 13, 10), GPSCoord(48, 11.7, 0)]
+    batch_a, batch_b = GPSBatch.from_gpscoords(a), GPSBatch.from_gpscoords(b)
+    np.testing.assert_allclose(batch_a.distance(batch_b), [p.distance(q) for p, q in zip(a, b)])
+    np.testing.assert_allclose(batch_a.haversine(batch_b), [p.haversine(q) for p, q in zip(a, b)])
+    np.testing.assert_allclose(batch_a.ecef().T, [p.ecef().r for p in a])
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        ([1, 2], [1, 2, 3], [1, 2]),
+        ([1, 2], [1, 2], [1]),
+        ([1, 2], [1, 2], [1, 2], [0]),
+        ([[1, 2]], [[1, 2]], [[1, 2]]),
+        (1, 2, 3),
+    ],
+)
+def test_gps_batch_rejects_mismatched_input(args):
+    with pytest.raises(ValueError):
+        GPSBatch(*args)
+
+
+def test_gps_batch_distance_rejects_mismatched_lengths():
+    with pytest.raises(ValueError):
+        GPSBatch([1, 2], [1, 2], [1, 2]).distance(GPSBatch([1], [1], [1]))
+
+
+@pytest.mark.parametrize(
+    "coord",
+    [CartesianCoord(1, 2, 3), GPSCoord(1, 2, 3), ENUCoord(1, 2, 3), NEDCoord(1, 2, 3)],
+    ids=lambda c: type(c).__name__,
+)
+def test_sequence_protocol(coord):
+    assert len(coord) == 3
+    assert tuple(coord) == coord.r == (1.0, 2.0, 3.0)
+    assert coord[0] == 1.0
+    assert coord[-1] == 3.0
+    a, b, c = coord
+    assert (a, b, c) == coord.r
+
+
+def _same(a, b):
+    return a.r == b.r and (a.yaw == b.yaw or math.isnan(a.yaw) and math.isnan(b.yaw))
+
+
+def _same_msg(a, b, fields):
+    return all(
+        getattr(a, f) == getattr(b, f) or math.isnan(getattr(a, f)) and math.isnan(getattr(b, f)) for f in fields
+    )
+
+
+@pytest.mark.parametrize(
+    "coords",
+    [[], [GPSCoord(52, 13, 100, 0.5), GPSCoord(48.1, 11.6, 5, -1.0)], [GPSCoord(52, 13, 100), GPSCoord(1, 2, 3)]],
+    ids=["empty", "yaw", "no-yaw"],
+)
+def test_gps_msg_many_round_trip(coords):
+    msgs = GPSCoord.to_msg_many(coords)
+    assert len(msgs) == len(coords)
+    for msg, c in zip(msgs, coords):
+        assert _same_msg(msg, c.to_msg(), ("lat", "lon", "alt", "yaw"))
+    back = GPSCoord.from_msg_many(msgs)
+    assert len(back) == len(coords)
+    assert all(_same(b, GPSCoord.from_msg(m)) and _same(b, c) for b, m, c in zip(back, msgs, coords))
+
+
+def test_gps_from_msg_many_without_yaw_field():
+    msgs = [SimpleNamespace(lat=52.0, lon=13.0, alt=100.0), SimpleNamespace(lat=1.0, lon=2.0, alt=3.0)]
+    coords = GPSCoord.from_msg_many(msgs)
+    assert all(_same(c, GPSCoord.from_msg(m)) for c, m in zip(coords, msgs))
+    assert all(math.isnan(c.yaw) for c in coords)
+
+
+@pytest.mark.parametrize(
+    "coords",
+    [[], [NEDCoord(1, 2, 3, 0.5), NEDCoord(-4, 5, -6, -1.0)], [NEDCoord(1, 2, 3), NEDCoord(4, 5, 6)]],
+    ids=["empty", "yaw", "no-yaw"],
+)
+def test_ned_msg_many_round_trip(coords):
+    msgs = NEDCoord.to_msg_many(coords)
+    assert len(msgs) == len(coords)
+    for msg, c in zip(msgs, coords):
+        assert _same_msg(msg, c.to_msg(), ("n", "e", "d", "yaw"))
+    back = NEDCoord.from_msg_many(msgs)
+    assert len(back) == len(coords)
+    assert all(_same(b, NEDCoord.from_msg(m)) and _same(b, c) for b, m, c in zip(back, msgs, coords))
@@ -0,0 +1,52 @@
+import math
+
+import numpy as np
+import pytest
+
+from fcord import _kernels
+
+pytestmark = pytest.mark.filterwarnings("ignore:invalid value encountered:RuntimeWarning")
+
+LAT = np.array([52.0, -33.9, 0.0, 90.0, -90.0, math.nan, 10.0, math.inf, -math.inf, 45.0])
+LON = np.array([13.0, 151.2, 0.0, 0.0, 180.0, 8.0, math.nan, 8.0, 8.0, -179.9])
+ALT = np.array([100.0, 0.0, -50.0, 1000.0, 0.0, 0.0, 0.0, 0.0, 0.0, math.nan])
+# math.sin raises on inf in plain Python, so scalar kernels are only compared on finite and NaN input
+SCALAR = np.flatnonzero(~np.isinf(LAT))
+
+
+def test_ecef_batch_matches_numpy():
+    for _ in range(2):  # The second call used to hit a broken numba cache
+        np.testing.assert_array_equal(_kernels.ecef_batch(LAT, LON, ALT), _kernels.ecef_numpy(LAT, LON, ALT))
+
+
+def test_ecef_batch_broadcasts():
+    xyz = _kernels.ecef_batch([[52.0, 10.0]], [13.0, 20.0], 0.0)
+    assert xyz.shape == (3, 1, 2)
+    np.testing.assert_allclose(xyz[:, 0, :], _kernels.ecef_numpy(np.array([52.0, 10.0]), np.array([13.0, 20.0]), 0.0))
+
+
+def test_ecef_kernel_matches_numpy():
+    expected = _kernels.ecef_numpy(LAT, LON, ALT)
+    for i in SCALAR:
+        np.testing.assert_allclose(_kernels.ecef_kernel(LAT[i], LON[i], ALT[i]), expected[:, i], rtol=1e-15)
+
+
+def test_ecef_kernel_matches_python_fallback():
+    numba = pytest.importorskip("numba")
+    assert isinstance(_kernels.ecef_kernel, numba.core.registry.CPUDispatcher)
+    for i in SCALAR:
+        np.testing.assert_allclose(
+            _kernels.ecef_kernel(LAT[i], LON[i], ALT[i]), _kernels.ecef_kernel.py_func(LAT[i], LON[i], ALT[i]), rtol=1e-15
+        )
+
+
+def test_haversine_kernel_matches_batch():
+    lat2 = np.roll(LAT, 1)
+    lon2 = np.roll(LON, 1)
+    expected = _kernels.haversine_batch(LAT, LON, lat2, lon2)
+    for i in np.flatnonzero(~np.isinf(LAT) & ~np.isinf(lat2)):
+        np.testing.assert_allclose(_kernels.haversine_kernel(LAT[i], LON[i], lat2[i], lon2[i]), expected[i], rtol=1e-12)
+
+
+def test_haversine_antipodal():
+    assert _kernels.haversine_kernel(0.0, 0.0, 0.0, 180.0) == pytest.approx(math.pi * _kernels.R_MEAN)
@@ -0,0 +1,70 @@
+import math
+
+import numpy as np
+import pytest
+
+from fcord._kernels import ONE_MINUS_E2, ecef_kernel
+from fcord._ned_lla import _ecef2lla, _ecef2lla_batch, ned2lla, ned2lla_batch
+
+rng = np.random.default_rng(0)
+REF_LAT = rng.uniform(-89.9, 89.9, 2000)
+REF_LON = rng.uniform(-180, 180, 2000)
+REF_ALT = rng.uniform(-100, 10000, 2000)
+NED = rng.uniform(-20000, 20000, (2000, 3))
+
+# Olson's method switches branches where the squared cosine of the geocentric latitude passes 0.3,
+# converted here to the geodetic latitude of that point on the ellipsoid surface
+SWITCH_LAT = math.degrees(math.atan(math.tan(math.acos(math.sqrt(0.3))) / ONE_MINUS_E2))
+
+
+def test_matches_navpy():
+    navpy = pytest.importorskip("navpy")
+    for ned, lat, lon, alt in zip(NED, REF_LAT, REF_LON, REF_ALT):
+        expected = navpy.ned2lla(ned, lat, lon, alt)
+        result = ned2lla(*ned, lat, lon, alt)
+        np.testing.assert_allclose(result[:2], expected[:2], rtol=0, atol=1e-9)
+        # navpy's own ECEF round trip is only good to about a centimetre
+        np.testing.assert_allclose(result[2], expected[2], rtol=0, atol=2e-2)
+
+
+def test_batch_matches_scalar():
+    for lat, lon, alt in zip(REF_LAT[:20], REF_LON[:20], REF_ALT[:20]):
+        batch = np.array(ned2lla_batch(NED[:, 0], NED[:, 1], NED[:, 2], lat, lon, alt)).T
+        scalar = [ned2lla(*ned, lat, lon, alt) for ned in NED]
+        np.testing.assert_allclose(batch, scalar, rtol=0, atol=1e-9)
+
+
+@pytest.mark.parametrize("lat", [-90.0, -89.999, SWITCH_LAT - 1e-6, SWITCH_LAT, SWITCH_LAT + 1e-6, 0.0, 89.999, 90.0])
+@pytest.mark.parametrize("alt", [-100.0, 0.0, 10000.0])
+def test_ecef_round_trip(lat, alt):
+    xyz = ecef_kernel(lat, 42.0, alt)
+    for result in (_ecef2lla(*xyz), [v[0] for v in _ecef2lla_batch(*(np.array([v]) for v in xyz))]):
+        assert result[0] == pytest.approx(lat, abs=1e-9)
+        assert result[2] == pytest.approx(alt, abs=1e-6)
+        if abs(lat) < 90:
+            assert result[1] == pytest.approx(42.0, abs=1e-9)
+
+
+def test_branch_switch_is_continuous():
+    lats = np.linspace(SWITCH_LAT - 1e-3, SWITCH_LAT + 1e-3, 101)
+    xyz = np.array([ecef_kernel(lat, 0.0, 0.0) for lat in lats]).T
+    c2 = (xyz[0] ** 2 + xyz[1] ** 2) / (xyz ** 2).sum(axis=0)
+    assert (c2 > 0.3).any() and (c2 <= 0.3).any()
+    lat, _, alt = _ecef2lla_batch(*xyz)
+    np.testing.assert_allclose(lat, lats, rtol=0, atol=1e-9)
+    np.testing.assert_allclose(alt, 0.0, rtol=0, atol=1e-6)
+
+
+@pytest.mark.parametrize("ref_lat", [-90.0, 90.0])
+def test_offsets_at_the_poles(ref_lat):
+    sign = math.copysign(1, ref_lat)
+    assert ned2lla(0, 0, 0, ref_lat, 0, 0) == pytest.approx((ref_lat, 0, 0), abs=1e-9)
+    # Going up or down at a pole only changes the altitude
+    lat, _, alt = ned2lla(0, 0, -100, ref_lat, 0, 0)
+    assert (lat, alt) == pytest.approx((ref_lat, 100), abs=1e-6)
+    # Going north from either pole moves towards the equator
+    lat, _, _ = ned2lla(1000, 0, 0, ref_lat, 0, 0)
+    assert sign * lat < 90
+    lat_batch, _, alt_batch = ned2lla_batch([0, 0], [0, 0], [0, -100], ref_lat, 0, 0)
+    np.testing.assert_allclose(lat_batch, ref_lat, rtol=0, atol=1e-9)
+    np.testing.assert_allclose(alt_batch, [0, 100], rtol=0, atol=1e-6)